@@ -81,6 +81,7 @@ class StorageJob(GenericJob):
         self._storage_type = StorageType(storage_type='local')
         self._storage_type_store = DataContainer(table_name="storage_type")
         self._external_storage = None
+        self._hdf_dirty = False
 
     def _before_generic_remove_child(self):
         if self._storage_type.s3 and self._external_storage.is_dir(self.path):
@@ -120,6 +121,7 @@ class StorageJob(GenericJob):
         self._storage_type_store.s3_config.config = config
         self._storage_type_store.s3_config.bucket_info = self._external_storage.bucket_info
         self._storage_type_store.s3_config.bucket_name = bucket_name
+        self._hdf_dirty = True
 
     def _list_groups(self):
         return []
@@ -132,6 +134,7 @@ class StorageJob(GenericJob):
         if 's3_config' in self._storage_type_store.keys():
             del self._storage_type_store.s3_config
         self._external_storage = None
+        self._hdf_dirty = True
 
     @property
     def files_stored(self):
@@ -189,6 +192,7 @@ class StorageJob(GenericJob):
             raise IOError(f"Storing {file} failed") from e
         else:
             self._stored_files[os.path.basename(file)] = metadata
+            self._hdf_dirty = True
 
     def _remove_file(self, file):
         try:
@@ -200,6 +204,7 @@ class StorageJob(GenericJob):
             raise IOError(f"Removing {file} failed") from e
         else:
             del self._stored_files[file]
+            self._hdf_dirty = True
 
     def remove_files(self, filenames, dryrun=True, raise_error=True, silent=False):
         """Remove files in the storage
@@ -242,7 +247,10 @@ class StorageJob(GenericJob):
         self.to_hdf()
 
     def interactive_close(self):
-        self.to_hdf()
+        # run_if_interactive already wrote the job after the last modification, so only write again if something
+        # changed since then
+        if self._hdf_dirty:
+            self.to_hdf()
 
     def interactive_fetch(self):
         pass
@@ -293,6 +301,7 @@ class StorageJob(GenericJob):
         self._storage_type_store.storage_type = self.storage_type
         self._storage_type_store.fixed_storage_type = self._storage_type.read_only
         self._storage_type_store.to_hdf(hdf=self._hdf5)
+        self._hdf_dirty = False
 
     def __getitem__(self, item):
         # copied from super().__getitem__ changing the output of returning a file
@@ -322,10 +331,14 @@ class StorageJob(GenericJob):
 
         # Here this function is changed to return a FileData object.
         if self._storage_type.local:
-            if name_lst[0] in self.list_files():
+            # check against the stored-files container instead of re-scanning the working directory with list_files;
+            # only files registered there have the metadata looked up below anyway
+            if name_lst[0] in self._stored_files.keys():
                 file_name = posixpath.join(self.working_directory, "{}".format(item_obj))
                 return FileData(file=file_name, metadata=self._stored_files[item])
         elif self._storage_type.s3:
             if name_lst[0] in self._external_storage.list_nodes():
-                return self._external_storage[name_lst[0]]
+                # fetch directly instead of going through FileS3IO.__getitem__, which would list the bucket again
+                # just to re-check the membership established above
+                return self._external_storage.get(name_lst[0])
         return None
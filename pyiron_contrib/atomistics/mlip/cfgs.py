@@ -2,6 +2,9 @@
 # http://gitlab.skoltech.ru/shapeev/mlip-dev/blob/master/src/external/python/mlippy/cfgs.py
 
 from __future__ import print_function
+import sys
+from itertools import islice
+
 import numpy as np
 
 
@@ -32,25 +35,17 @@ def readcfg(f):
                 cfg.types = np.zeros(size)
                 cfg.pos = np.zeros((size, 3))
             elif line.startswith('SUPERCELL'):
-                line = f.readline()
-                vals = line.strip().split()
-                cfg.lat[0, :] = vals[0:3]
-                line = f.readline()
-                vals = line.strip().split()
-                cfg.lat[1, :] = vals[0:3]
-                line = f.readline()
-                vals = line.strip().split()
-                cfg.lat[2, :] = vals[0:3]
+                block = ''.join(islice(f, 3))
+                cfg.lat = np.fromstring(block, dtype=np.float64, sep=' ').reshape(3, 3)
             elif line.startswith('ATOMDATA'):
+                # parse the whole atom block in one go instead of line by line,
+                # so tokenization and float conversion happen in C
+                block = ''.join(islice(f, size))
+                vals = np.fromstring(block, dtype=np.float64, sep=' ').reshape(size, -1)
+                cfg.types = vals[:, 1].copy()
+                cfg.pos = vals[:, 2:5].copy()
                 if line.endswith('FZ'):
-                    cfg.forces = np.zeros((size, 3))
-                for i in range(size):
-                    line = f.readline()
-                    vals = line.strip().split()
-                    cfg.types[i] = vals[1]
-                    cfg.pos[i, :] = vals[2:5]
-                    if cfg.forces is not None:
-                        cfg.forces[i, :] = vals[5:8]
+                    cfg.forces = vals[:, 5:8].copy()
             elif line.startswith('ENERGY'):
                 items = line.split()
                 if len(items) == 1:
@@ -59,10 +54,7 @@ def readcfg(f):
                 else:
                     cfg.energy = float(items[-1])
             elif line.startswith('PLUSSTRESS'):
-                line = f.readline()
-                vals = line.strip().split()
-                cfg.stresses = np.zeros(6)
-                cfg.stresses[:] = vals[0:6]
+                cfg.stresses = np.fromstring(f.readline(), dtype=np.float64, sep=' ')[:6]
             elif line.startswith('FEATURE   MV_GRADE'):
                 cfg.grade = float(line.split()[-1])
             elif line.startswith('FEATURE   PYIRON'):
@@ -78,6 +70,8 @@ def readcfg(f):
 def savecfg(f, cfg, desc=None):
     atstr1 = 'AtomData:  id type       cartes_x      cartes_y      cartes_z           fx          fy          fz'
     atstr2 = 'AtomData:  id type       cartes_x      cartes_y      cartes_z'
+    if f is None:
+        f = sys.stdout
     size = len(cfg.types)
     print('BEGIN_CFG', file=f)
     print('Size', file=f)
@@ -91,15 +85,14 @@ def savecfg(f, cfg, desc=None):
         print(atstr1, file=f)
     else:
         print(atstr2, file=f)
-    for i in range(size):
-        if cfg.forces is not None:
-            print('         %4d %4d %14f%14f%14f %16.8e %16.8e %16.8e' %
-                  (i+1, cfg.types[i], cfg.pos[i, 0], cfg.pos[i, 1], cfg.pos[i, 2],
-                   cfg.forces[i, 0], cfg.forces[i, 1], cfg.forces[i, 2]), file=f)
-        else:
-            print('         %4d %4d %14f%14f%14f' %
-                  (i+1, cfg.types[i], cfg.pos[i, 0], cfg.pos[i, 1], cfg.pos[i, 2]),
-                  file=f)
+    # format the whole atom block in one savetxt call instead of printing row by row
+    ids = np.arange(1, size + 1)
+    if cfg.forces is not None:
+        data = np.column_stack((ids, cfg.types, cfg.pos, cfg.forces))
+        np.savetxt(f, data, fmt='         %4d %4d %14f%14f%14f %16.8e %16.8e %16.8e')
+    else:
+        data = np.column_stack((ids, cfg.types, cfg.pos))
+        np.savetxt(f, data, fmt='         %4d %4d %14f%14f%14f')
     if cfg.energy is not None:
         print('Energy\t%14f' % cfg.energy, file=f)
     if cfg.stresses is not None:
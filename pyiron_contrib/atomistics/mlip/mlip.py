@@ -36,6 +36,7 @@ class Mlip(GenericJob, PotentialFit):
         self.__name__ = "Mlip"
         self._executable_activate()
         self._job_dict = {}
+        self._inspect_cache = {}
         self.input = MlipParameter()
         self._command_line = CommandLine()
         self._potential = MtpPotential()
@@ -68,13 +69,22 @@ class Mlip(GenericJob, PotentialFit):
         if os.path.exists(pot) and os.path.exists(states):
             return [pot, states]
 
+    def _inspect_job(self, job_id):
+        """
+        Inspect a job from the database, hitting the database at most once per job id for the lifetime of this object.
+        """
+        job_id = int(job_id)
+        if job_id not in self._inspect_cache:
+            self._inspect_cache[job_id] = self.project.inspect(job_id)
+        return self._inspect_cache[job_id]
+
     def _get_elements(self):
         """
         Return elements in training in insertion order, i.e. elements seen earlier get lower indices.
         """
         elements = []
         for job_id in self._job_dict:
-            j = self.project.inspect(job_id)
+            j = self._inspect_job(job_id)
             if j["NAME"] == "TrainingContainer":
                 candidates = j.to_object().get_elements()
             else:
@@ -130,7 +140,7 @@ class Mlip(GenericJob, PotentialFit):
 
     def add_job_to_fitting(self, job_id, time_step_start=0, time_step_end=-1, time_step_delta=10):
         if time_step_end == -1:
-            time_step_end = np.shape(self.project.inspect(int(job_id))['output/generic/cells'])[0]-1
+            time_step_end = np.shape(self._inspect_job(job_id)['output/generic/cells'])[0]-1
         self._job_dict[job_id] = {'time_step_start': time_step_start,
                                   'time_step_end': time_step_end,
                                   'time_step_delta': time_step_delta}
@@ -344,7 +354,7 @@ class Mlip(GenericJob, PotentialFit):
         indices_lst, position_lst, forces_lst, cell_lst, energy_lst, track_lst, stress_lst = [], [], [], [], [], [], []
         all_species = set()
         for job_id, value in self._job_dict.items():
-            ham = self.project.inspect(job_id)
+            ham = self._inspect_job(job_id)
             if respect_step:
                 start = value['time_step_start']
                 end = value['time_step_end']+1
@@ -547,27 +557,43 @@ def write_cfg(file_name, indices_lst, position_lst, cell_lst, forces_lst=None, e
         track_lst = [None] * len(position_lst)
     if energy_lst is None or len(energy_lst) == 0:
         energy_lst = [None] * len(position_lst)
-    cfg_lst = []
-    for indices, position, forces, cell, energy, stress, track_str in zip(
-            indices_lst,
-            position_lst,
-            forces_lst,
-            cell_lst,
-            energy_lst,
-            stress_lst,
-            track_lst
-    ):
-        cfg_object = Cfg()
-        cfg_object.pos = position
-        cfg_object.lat = cell
-        cfg_object.types = indices
-        cfg_object.energy = energy
-        cfg_object.forces = forces
-        cfg_object.stresses = stress
-        if track_str is not None:
-            cfg_object.desc = 'pyiron\t' + track_str
-        cfg_lst.append(cfg_object)
-    savecfgs(filename=file_name, cfgs=cfg_lst, desc=None)
+    def cfg_iter():
+        # build each Cfg lazily while savecfgs streams them to disk, instead of materializing one object per
+        # structure up front
+        for indices, position, forces, cell, energy, stress, track_str in zip(
+                indices_lst,
+                position_lst,
+                forces_lst,
+                cell_lst,
+                energy_lst,
+                stress_lst,
+                track_lst
+        ):
+            cfg_object = Cfg()
+            cfg_object.pos = position
+            cfg_object.lat = cell
+            cfg_object.types = indices
+            cfg_object.energy = energy
+            cfg_object.forces = forces
+            cfg_object.stresses = stress
+            if track_str is not None:
+                cfg_object.desc = 'pyiron\t' + track_str
+            yield cfg_object
+    savecfgs(filename=file_name, cfgs=cfg_iter(), desc=None)
+
+
+def _stack_configurations(value_lst):
+    """
+    Stack per-configuration arrays into a single homogeneous ndarray if all shapes agree, so that HDF5 can store them
+    chunked and compressed. Ragged data stays a plain list of contiguous arrays, which skips numpy's per-element shape
+    probing and avoids object arrays entirely.
+    """
+    value_lst = [np.asarray(value) for value in value_lst]
+    if len(value_lst) == 0:
+        return np.array([])
+    if all(value.shape == value_lst[0].shape for value in value_lst[1:]):
+        return np.stack(value_lst)
+    return value_lst
 
 
 def read_cgfs(file_name):
@@ -596,5 +622,6 @@ def read_cgfs(file_name):
             job_id, timestep = cgf.desc.split('_')
             jobids.append(int(job_id))
             timesteps.append(int(timestep))
-    return [np.array(cell), np.array(positions), np.array(forces), np.array(stress), np.array(energy),
-            np.array(indicies), np.array(grades), np.array(jobids), np.array(timesteps)]
+    return [_stack_configurations(cell), _stack_configurations(positions), _stack_configurations(forces),
+            _stack_configurations(stress), np.array(energy), _stack_configurations(indicies), np.array(grades),
+            np.array(jobids), np.array(timesteps)]
@@ -7,7 +7,6 @@ Demonstrator job for the RuNNer Neural Network Potential.
 """
 
 import os.path
-from glob import glob
 
 from pyiron_base import state, GenericJob, Executable, DataContainer
 
@@ -115,7 +114,11 @@ class RunnerFit(GenericJob):
         """
         if not self.status.finished:
             raise RuntimeError("Job must have successfully finished before potential files can be copied!")
-        weight_file = glob(f'{self.working_directory}/weights.*.data')[0]
+        # scandir with a prefix/suffix test instead of glob, which pattern-matches every directory entry
+        weight_file = next(
+                e.path for e in os.scandir(self.working_directory)
+                if e.name.startswith('weights.') and e.name.endswith('.data')
+        )
         return pd.DataFrame({
                     'Name': ['RuNNer-Cu'],
                     'Filename': [[f'{self.working_directory}/input.nn',
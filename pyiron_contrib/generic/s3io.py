@@ -184,6 +184,8 @@ class FileS3IO(HasGroups):
 
         self._bucket = self._s3io.bucket
         self._s3_path = None
+        self._list_cache = {}
+        self._file_cache = {}
         self.s3_path = path
 
     @property
@@ -231,9 +233,15 @@ class FileS3IO(HasGroups):
         """
         List directories/groups in the current group.
 
+        Results are cached per path to avoid re-listing the bucket on every access; the cache is dropped whenever the
+        bucket content is modified.
+
         Returns:
             list: list of directory names.
         """
+        cached = self._list_cache.get((self._bucket_path, 'groups'))
+        if cached is not None:
+            return list(cached)
         groups = []
         group_path_len = len(self._bucket_path.split('/')) - 1
         for obj in self._list_objects():
@@ -241,19 +249,32 @@ class FileS3IO(HasGroups):
             if len(rel_obj_path_spl) > 1:
                 if rel_obj_path_spl[0] not in groups:
                     groups.append(rel_obj_path_spl[0])
-        return groups
+        self._list_cache[(self._bucket_path, 'groups')] = groups
+        return list(groups)
 
     def _list_nodes(self):
         """
         List of 'files' ( string not followed by '/' ) in the current group.
 
+        Results are cached per path to avoid re-listing the bucket on every access; the cache is dropped whenever the
+        bucket content is modified.
+
         Returns:
             list: list of file names.
         """
+        cached = self._list_cache.get((self._bucket_path, 'nodes'))
+        if cached is not None:
+            return list(cached)
         nodes = []
         for obj in self._bucket.objects.filter(Prefix=self._bucket_path, Delimiter='/'):
             nodes.append(obj.key.split('/')[-1])
-        return nodes
+        self._list_cache[(self._bucket_path, 'nodes')] = nodes
+        return list(nodes)
+
+    def _invalidate_list_cache(self):
+        """Drop cached `list_nodes`/`list_groups` results and file handles after the bucket content changed."""
+        self._list_cache.clear()
+        self._file_cache.clear()
 
     def _to_abs_bucketpath(self, path):
         """Helper function to convert a given path to an absolute path inside the S3 bucket."""
@@ -350,6 +371,7 @@ class FileS3IO(HasGroups):
                 self._bucket_path + filename,
                 {"Metadata": metadata}
             )
+        self._invalidate_list_cache()
 
     def download(self, files, targetpath="."):
         """
@@ -390,8 +412,11 @@ class FileS3IO(HasGroups):
         Returns:
         """
         file = self._to_abs_bucketpath(file)
-        s3object = S3FileData(s3obj=self._bucket.Object(file))
-        return s3object
+        # reuse the wrapper so repeated access to the same file also reuses its already downloaded data;
+        # the cache is dropped whenever the bucket content changes
+        if file not in self._file_cache:
+            self._file_cache[file] = S3FileData(s3obj=self._bucket.Object(file))
+        return self._file_cache[file]
 
     def get_s3_object(self, file):
         """
@@ -434,6 +459,7 @@ class FileS3IO(HasGroups):
         if metadata is None:
             metadata = {}
         self._bucket.put_object(Key=path, Body=data_obj, Metadata=metadata)
+        self._invalidate_list_cache()
 
     def _list_objects(self):
         return self._bucket.objects.filter(Prefix=self._bucket_path)
@@ -489,6 +515,7 @@ class FileS3IO(HasGroups):
             raise ValueError(f"{file} is not a file.")
         file = self._to_abs_bucketpath(file)
         self._bucket.Object(file).delete()
+        self._invalidate_list_cache()
         #self._remove_object(prefix=file, debug=debug)
 
     def remove_group(self, path=None, debug=False):
@@ -517,6 +544,7 @@ class FileS3IO(HasGroups):
         if debug:
             print(f'\nDeleting all objects with sample prefix {self._bucket.name}/{prefix}.')
         delete_responses = self._bucket.objects.filter(Prefix=prefix).delete()
+        self._invalidate_list_cache()
         if debug:
             for delete_response in delete_responses:
                 for deleted in delete_response['Deleted']:
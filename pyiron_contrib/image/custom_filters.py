@@ -4,8 +4,6 @@ from __future__ import print_function
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 __author__ = "Liam Huber"
 __copyright__ = "Copyright 2019, Max-Planck-Institut für Eisenforschung GmbH " \
@@ -39,9 +37,9 @@ def brightness_filter(image, sigma=10, bins=100, deg=10, plot=False):
     """
     # Smooth out to avoid checker-board of secondary phase
     image.reload_data()
-    raw_data = image.data.copy()
+    # The raw data is only needed for the summary plot, so skip the full-image copy otherwise
+    raw_data = image.data.copy() if plot else None
     image.filters.gaussian(sigma=sigma)
-    signal = image.data.flatten()
 
     # Find 'dark' and 'light' signal peaks
     counts, edges = np.histogram(image.data.flatten(), bins=bins)
@@ -65,9 +63,13 @@ def brightness_filter(image, sigma=10, bins=100, deg=10, plot=False):
     phase_fraction = np.mean(phase_mask)
 
     if plot:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
         # Plot the signal distribution
+        signal = image.data.flatten()
         _, ax = plt.subplots(figsize=(12, 6))
-        sns.distplot(signal, ax=ax, norm_hist=False, kde=False, label='brightness distribution')
+        sns.histplot(signal, ax=ax, label='brightness distribution')
         ax.plot(bincenters, poly(bincenters), label='fit')
 
         ax.axvline(bincenters[peak_id], color='w', linestyle='--')
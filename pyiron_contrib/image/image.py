@@ -4,12 +4,10 @@ from __future__ import print_function
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import inspect
+from functools import lru_cache
 from pkgutil import iter_modules
 
 import numpy as np
-import skimage
-from matplotlib import pyplot as plt
-from skimage import io
 from collections import UserDict
 
 from pyiron_contrib.image.utils import ModuleScraper
@@ -32,6 +30,52 @@ __date__ = "Feb 6, 2020"
 # This is done by searching the signature for the variable name below:
 _IMAGE_VARIABLE = 'image'
 
+# Importing skimage and scanning its submodules is expensive, so it is deferred until the first `Image` is built and
+# the resulting submodule names are shared by all instances.
+_SKIMAGE_SUBMODULE_NAMES = None
+
+
+def _get_skimage_submodule_names():
+    global _SKIMAGE_SUBMODULE_NAMES
+    if _SKIMAGE_SUBMODULE_NAMES is None:
+        import skimage
+        submodule_blacklist = [
+            'data',
+            'scripts',
+            'future',
+            'registration',
+        ]
+        _SKIMAGE_SUBMODULE_NAMES = [
+            module.name for module in iter_modules(skimage.__path__)
+            if module.name[0] != '_' and module.name not in submodule_blacklist
+        ]
+    return _SKIMAGE_SUBMODULE_NAMES
+
+
+class _LazyDocCall:
+    # Thin callable wrapper whose combined docstring is only assembled when `__doc__` is actually read. Wrapping
+    # happens for every scraped skimage function on every Image, but the docstrings are rarely inspected.
+    def __init__(self, call, function, prefix):
+        self._call = call
+        self._function = function
+        self._prefix = prefix
+
+    def __call__(self, *args, **kwargs):
+        return self._call(*args, **kwargs)
+
+    @property
+    def __doc__(self):
+        return self._prefix + (self._function.__doc__ or "")
+
+
+@lru_cache(maxsize=None)
+def _takes_image_data(function):
+    """
+    Whether the first parameter of the function is named `_IMAGE_VARIABLE`. Cached since `inspect.signature` is slow
+    and the same skimage functions get wrapped again for every new `Image`.
+    """
+    return next(iter(inspect.signature(function).parameters)) == _IMAGE_VARIABLE
+
 
 def pass_image_data(image):
     """
@@ -46,7 +90,7 @@ def pass_image_data(image):
     """
 
     def decorator(function):
-        takes_image_data = list(inspect.signature(function).parameters.keys())[0] == _IMAGE_VARIABLE
+        takes_image_data = _takes_image_data(function)
 
         def wrapper(*args, **kwargs):
             if takes_image_data:
@@ -54,13 +98,11 @@ def pass_image_data(image):
             else:
                 return function(*args, **kwargs)
 
-        wrapper.__doc__ = ""
+        prefix = "The original docstring follows:\n\n"
         if takes_image_data:
-            wrapper.__doc__ += "This function has been wrapped to automatically supply the image argument. \n" \
-                               "Remaining arguments can be passed as normal.\n"
-        wrapper.__doc__ += "The original docstring follows:\n\n"
-        wrapper.__doc__ += function.__doc__ or ""
-        return wrapper
+            prefix = "This function has been wrapped to automatically supply the image argument. \n" \
+                     "Remaining arguments can be passed as normal.\n" + prefix
+        return _LazyDocCall(wrapper, function, prefix)
 
     return decorator
 
@@ -85,9 +127,8 @@ def set_image_data(image):
             else:
                 return output
 
-        wrapper.__doc__ = "This function has been wrapped; if it outputs a numpy array, it will be " \
-                          "automatically passed to the image's data field.\n" + function.__doc__
-        return wrapper
+        return _LazyDocCall(wrapper, function, "This function has been wrapped; if it outputs a numpy array, it "
+                                               "will be automatically passed to the image's data field.\n")
 
     return decorator
 
@@ -121,6 +162,10 @@ class Image:
         metadata (Metadata): Metadata associated with the source.
     """
 
+    # Images get created in bulk by batch jobs, so skip the per-instance `__dict__`; the scraped skimage submodules
+    # live in the `_scrapers` dict and are resolved through `__getattr__`.
+    __slots__ = ('_source', '_data', 'as_gray', '_metadata', '_scrapers')
+
     def __init__(self, source, metadata=None, as_gray=False):
         """
         source (str/numpy.ndarray): The raw data source.
@@ -129,6 +174,7 @@ class Image:
         """
 
         # Set data
+        self._scrapers = {}
         self._source = source
         self._data = None
         self.as_gray = as_gray
@@ -137,26 +183,25 @@ class Image:
         self._metadata = None
         self.metadata = metadata or Metadata()
 
-        # Apply wrappers
-        submodule_blacklist = [
-            'data',
-            'scripts',
-            'future',
-            'registration',
-
-        ]
-        for module in iter_modules(skimage.__path__):
-            if module.name[0] == '_' or module.name in submodule_blacklist:
-                continue
-            setattr(
-                self,
-                module.name,
-                ModuleScraper(
-                    'skimage.' + module.name,
-                    decorator=pass_and_set_image_data,
-                    decorator_args=(self,)
-                )
+    def __getattr__(self, item):
+        # Wrappers around the skimage submodules are only built on first access
+        try:
+            scrapers = object.__getattribute__(self, '_scrapers')
+        except AttributeError:
+            raise AttributeError(item)
+        try:
+            return scrapers[item]
+        except KeyError:
+            pass
+        if item in _get_skimage_submodule_names():
+            scraper = ModuleScraper(
+                'skimage.' + item,
+                decorator=pass_and_set_image_data,
+                decorator_args=(self,)
             )
+            scrapers[item] = scraper
+            return scraper
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, item))
 
     @property
     def source(self):
@@ -211,6 +256,7 @@ class Image:
             if len(self._data.shape) == 3:
                 self.convert_to_grayscale()
         elif isinstance(self.source, str):
+            from skimage import io
             self._data = io.imread(self.source, as_gray=self.as_gray)
         else:
             raise ValueError("Data source not understood, should be numpy.ndarray or string pointing to image file.")
@@ -223,13 +269,18 @@ class Image:
 
         self._load_data_from_source()
 
+    # Luminance weights as used by skimage.color.rgb2gray, so array sources match files read with `as_gray=True`.
+    # float32 avoids the float64 upcast of a plain `np.mean` and lets the reduction run as a BLAS matrix-vector product.
+    _GRAYSCALE_WEIGHTS = np.array([0.2989, 0.5870, 0.1140], dtype=np.float32)
+
     def convert_to_grayscale(self):
         """
         Flattens (NxMx3) data into (NxM) grayscale data.
         """
-        if self._data is not None:
-            if len(self.data.shape) == 3 and self.data.shape[-1] == 3:
-                self._data = np.mean(self._data, axis=-1)
+        data = self._data
+        if data is not None:
+            if data.ndim == 3 and data.shape[2] == 3:
+                self._data = data @ self._GRAYSCALE_WEIGHTS
                 self.as_gray = True
             else:
                 raise ValueError("Can only convert data with shape NxMx3 to grayscale")
@@ -252,6 +303,8 @@ class Image:
             (matplotlib.axes.Axes): The axis the plot is on.
         """
 
+        from matplotlib import pyplot as plt
+
         subplots_kwargs = subplots_kwargs or {}
         imshow_kwargs = imshow_kwargs or {}
 
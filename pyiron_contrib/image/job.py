@@ -5,7 +5,6 @@ from __future__ import print_function
 
 from pyiron_base import GenericJob
 import numpy as np
-import matplotlib.pyplot as plt
 from os.path import isfile
 from glob import iglob
 from os.path import abspath
@@ -58,7 +57,7 @@ class ImageJob(GenericJob):
         if isinstance(val, DistributingList):
             self._images = val
         elif isinstance(val, (tuple, list, np.ndarray)):
-            if not all([isinstance(obj, Image) for obj in val]):
+            if not all(isinstance(obj, Image) for obj in val):
                 raise ValueError("Only `Image`-type objects can be set to the `images` attribute.")
             self._images = DistributingList(val)
         else:
@@ -86,6 +85,8 @@ class ImageJob(GenericJob):
             (list): The axes the plot is on.
         """
 
+        import matplotlib.pyplot as plt
+
         if mask is not None:
             images = self.images[mask]
         else:
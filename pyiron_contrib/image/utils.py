@@ -158,6 +158,10 @@ class ModuleScraper:
     scrape_primitives = LockedIfAttributeTrue(True, '_activated')
     primitives_list = LockedIfAttributeTrue((int, float, bool, np.ndarray), '_activated')
 
+    # Registry of module members shared by all scrapers, so that scraping the same module for a second instance
+    # (e.g. one scraper per Image) does not repeat the `inspect.getmembers` walk.
+    _member_registry = {}
+
     def __init__(
             self,
             module,
@@ -207,7 +211,13 @@ class ModuleScraper:
         else:
             module = import_module(self._module)
 
-        for name, obj in inspect.getmembers(module):
+        try:
+            members = ModuleScraper._member_registry[module.__name__]
+        except KeyError:
+            members = inspect.getmembers(module)
+            ModuleScraper._member_registry[module.__name__] = members
+
+        for name, obj in members:
             if self.safe and name[0] == '_':
                 continue
             elif self.recursive and inspect.ismodule(obj) and obj.__package__ == module.__package__:
@@ -23,6 +23,8 @@ KB = physical_constants['Boltzmann constant in eV/K'][0]
 HBAR = physical_constants['Planck constant over 2 pi in eV s'][0]
 ROOT_EV_PER_ANGSTROM_SQUARE_PER_AMU_IN_S = 9.82269385e13
 # https://www.wolframalpha.com/input/?i=sqrt((eV)+%2F+((atomic+mass+units)*(angstroms%5E2)))
+# np.trapz was renamed to np.trapezoid in numpy 2
+_trapezoid = np.trapezoid if hasattr(np, 'trapezoid') else np.trapz
 
 """
 Protocols for thermodynamic integration using langevin dynamics (TILD).
@@ -77,7 +79,7 @@ class _TILDParent(CompoundVertex):
         return fig, ax
 
     def get_tild_free_energy_change(self):
-        return np.trapz(x=self.get_lambdas(), y=self.get_tild_integrands()[0])
+        return _trapezoid(x=self.get_lambdas(), y=self.get_tild_integrands()[0])
 
 
 class HarmonicTILD(_TILDParent):
@@ -401,11 +403,12 @@ class HarmonicTILD(_TILDParent):
             temperatures = self.input.temperature
         temperatures = np.clip(temperatures, 1e-6, np.inf)
         beta = 1. / (KB * temperatures)
-        f = 0
-        for m in self.input.structure.get_masses():
-            hbar_omega = HBAR * np.sqrt(self.input.spring_constant / m) * ROOT_EV_PER_ANGSTROM_SQUARE_PER_AMU_IN_S
-            f += (3. / 2) * hbar_omega + ((3. / beta) * np.log(1 - np.exp(-beta * hbar_omega)))
-        return f
+        # One vectorized evaluation over all atomic masses instead of a per-atom loop of scalar ufunc calls;
+        # the outer product keeps array-valued temperatures broadcasting as before
+        masses = np.asarray(self.input.structure.get_masses())
+        hbar_omegas = HBAR * np.sqrt(self.input.spring_constant / masses) * ROOT_EV_PER_ANGSTROM_SQUARE_PER_AMU_IN_S
+        log_terms = np.log(1 - np.exp(-np.multiply.outer(beta, hbar_omegas)))
+        return (3. / 2) * hbar_omegas.sum() + (3. / beta) * log_terms.sum(axis=-1)
 
 
 class ProtoHarmTILDSer(Protocol, HarmonicTILD):
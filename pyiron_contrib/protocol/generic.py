@@ -244,13 +244,16 @@ class Vertex(LoggerMixin, ABC):
             if key not in self.output:
                 self.output[key] = [value]
             else:
-                history = list(self.output[key])
-                # Roll the list if it is necessary
+                # Grab the stored history directly and roll it in place -- going through `self.output[key]` would
+                # rebuild the whole list (resolving each element) on every step
+                history = dict.__getitem__(self.output, key)
+                if not isinstance(history, list):
+                    history = list(history)
+                    self.output[key] = history
                 history.append(value)
                 if len(history) > self.n_history:
                     # Remove the head of the queue
                     history.pop(0)
-                self.output[key] = history
 
     def update_and_archive(self, output_data):
         self._update_output(output_data)
@@ -840,12 +843,11 @@ class Graph(dict, LoggerMixin):
 
     def _edge_from_pointer(self, key, p):
         assert isinstance(p, Pointer)
-        path = p.path.copy()
-        root = path.pop(0)
+        root = p.path[0]
 
+        # walk the remaining crumbs in one pass instead of copying the path and popping from the front
         result = root.object
-        while len(path) > 0:
-            crumb = path.pop(0)
+        for crumb in p.path[1:]:
             crumb_type = crumb.crumb_type
             crumb_name = crumb.name
 
@@ -49,7 +49,13 @@ class _StringDistances(PrimitiveVertex):
         Returns:
             (bool): Whether the image is closest to its own parent centroid.
         """
-        distances = [np.linalg.norm(structure.find_mic(c_pos - positions)) for c_pos in all_centroid_positions]
+        # One broadcast find_mic over all centroids instead of a Python loop with one call per centroid; this runs
+        # every MD step through StringRecenter/StringReflect
+        all_centroid_positions = np.asarray(all_centroid_positions)
+        distances = np.linalg.norm(
+            structure.find_mic(all_centroid_positions - positions).reshape(len(all_centroid_positions), -1),
+            axis=1
+        )
         closest_centroid_positions = all_centroid_positions[np.argmin(distances)]
         match_distance = np.linalg.norm(structure.find_mic(closest_centroid_positions - centroid_positions))
         return match_distance < eps
@@ -201,21 +207,19 @@ class CentroidsRunningAverageMix(PrimitiveVertex):
 
     def command(self, structure, mixing_fraction, centroids_pos_list, running_average_positions, relax_endpoints):
 
-        centroids_pos_list = np.array(centroids_pos_list)
-        running_average_positions = np.array(running_average_positions)
+        centroids_pos_list = np.asarray(centroids_pos_list)
+        running_average_positions = np.asarray(running_average_positions)
 
-        updated_centroids = []
-
-        for i, (cent, avg) in enumerate(zip(centroids_pos_list, running_average_positions)):
-            if (i == 0 or i == (len(centroids_pos_list) - 1)) and not relax_endpoints:
-                updated_centroids.append(cent)
-            else:
-                displacement = structure.find_mic(avg - cent)
-                update = mixing_fraction * displacement
-                updated_centroids.append(cent + update)
+        # Mix all centroids towards their running averages in one broadcast update instead of collecting
+        # per-centroid arrays in a Python list and re-promoting them with np.array
+        displacements = structure.find_mic(running_average_positions - centroids_pos_list)
+        updated_centroids = centroids_pos_list + (mixing_fraction * displacements)
+        if not relax_endpoints:
+            updated_centroids[0] = centroids_pos_list[0]
+            updated_centroids[-1] = centroids_pos_list[-1]
 
         return {
-            'centroids_pos_list': np.array(updated_centroids)
+            'centroids_pos_list': updated_centroids
         }
 
 
@@ -373,11 +377,11 @@ class CentroidsReparameterization(PrimitiveVertex):
         Returns:
             lengths (list): Lengths of the positions in the list
         """
-        length_cummulative = 0
-        lengths = [length_cummulative]
-        # First length is zero, all other lengths are wrt the first position in the list
-        for n_left, term in enumerate(a_list[1:]):
-            disp = structure.find_mic(term - a_list[n_left])
-            length_cummulative += np.linalg.norm(disp)
-            lengths.append(length_cummulative)
+        # First length is zero, all other lengths are wrt the first position in the list. `find_mic` broadcasts over
+        # the leading axis, so all segments can be wrapped in a single call instead of one per pair
+        positions = np.asarray(a_list)
+        displacements = structure.find_mic(positions[1:] - positions[:-1])
+        segment_lengths = np.linalg.norm(displacements.reshape(len(displacements), -1), axis=1)
+        lengths = np.zeros(len(positions))
+        lengths[1:] = np.cumsum(segment_lengths)
         return lengths
@@ -9,7 +9,7 @@ from os.path import split
 from abc import ABC, abstractmethod
 from uncertainties import unumpy
 from scipy.constants import physical_constants
-from scipy.integrate import simps
+from scipy.integrate import simpson
 from ase.geometry import get_distances
 
 from pyiron_atomistics import Project
@@ -144,9 +144,12 @@ class DeleteAtom(PrimitiveVertex):
         self.input.default.atom_id = 0
 
     def command(self, structure, atom_id):
-        vacancy_structure = structure.copy()
-        vacancy_structure.pop(atom_id)
-        mask = np.delete(np.arange(len(structure)).astype(int), atom_id)
+        # Build the kept-atom mask once and gather the remaining atoms in a single slice instead of popping,
+        # which reshuffles the position and species arrays
+        keep = np.ones(len(structure), dtype=bool)
+        keep[atom_id] = False
+        mask = np.flatnonzero(keep)
+        vacancy_structure = structure[mask]
 
         return {
             'structure': vacancy_structure,
@@ -452,20 +455,21 @@ class GradientDescent(PrimitiveVertex):
     def command(self, positions, forces, gamma0, use_adagrad, fix_com, mask=None, masses=None,
                 output_displacements=True):
 
-        positions = np.array(positions)
-        forces = np.array(forces)
+        # asarray instead of array: the update below builds new arrays anyway, so skip the per-call input copies
+        positions = np.asarray(positions)
+        forces = np.asarray(forces)
         unmasked_positions = None
 
         if mask is not None:
             masked = True
-            mask = np.array(mask)
+            mask = np.asarray(mask)
             # Preserve data
             unmasked_positions = positions.copy()
 
             # Mask input data
             positions = positions[mask]
             forces = forces[mask]
-            masses = np.array(masses)[mask]
+            masses = np.asarray(masses)[mask]
         else:
             masked = False
 
@@ -473,10 +477,10 @@ class GradientDescent(PrimitiveVertex):
             self._accumulated_force += np.sqrt(np.sum(forces * forces))
             gamma0 /= self._accumulated_force
 
-        pos_change = gamma0 * np.array(forces)
+        pos_change = gamma0 * forces
 
         if fix_com:
-            masses = np.array(masses)[:, np.newaxis]
+            masses = np.asarray(masses)[:, np.newaxis]
             total_mass = np.sum(masses)
             com_change = np.sum(pos_change * masses, axis=0) / total_mass
             pos_change -= com_change
@@ -565,6 +569,8 @@ class HarmonicHamiltonian(PrimitiveVertex):
 
     def __init__(self, name=None):
         super(HarmonicHamiltonian, self).__init__(name=name)
+        self._raw_force_constants = None
+        self._transformed_force_constants = None
         id_ = self.input.default
         id_.spring_constant = None
         id_.force_constants = None
@@ -572,26 +578,38 @@ class HarmonicHamiltonian(PrimitiveVertex):
     def command(self, positions, reference_positions, structure, spring_constant=None, force_constants=None,
                 mask=None, eq_energy=None):
 
-        dr = structure.find_mic(positions - reference_positions)
         if spring_constant is not None and force_constants is None:
             if mask is not None:
-                forces = -spring_constant * dr[mask]
-                energy = -0.5 * np.dot(dr[mask], forces)
+                # Only the masked atoms enter the forces and energy, so subtract and wrap just that subset. The mask
+                # may be a scalar atom id (e.g. a vacancy id), so contract over whatever shape it leaves
+                dr_masked = structure.find_mic(positions[mask] - reference_positions[mask])
+                forces = -spring_constant * dr_masked
+                energy = 0.5 * spring_constant * np.sum(dr_masked * dr_masked)
             else:
+                dr = structure.find_mic(positions - reference_positions)
                 forces = -spring_constant * dr
-                energy = -0.5 * np.tensordot(dr, forces)
+                energy = 0.5 * spring_constant * np.einsum('ij,ij->', dr, dr)
 
         elif force_constants is not None and spring_constant is None:
-            transformed_force_constants = self.transform_force_constants(force_constants, len(structure.positions))
+            dr = structure.find_mic(positions - reference_positions)
+            # The Hessian does not change between steps, so flatten it to its contiguous (3N, 3N) layout once and
+            # reuse it; invalidate if a different matrix gets wired in
+            if self._transformed_force_constants is None or force_constants is not self._raw_force_constants:
+                self._transformed_force_constants = np.ascontiguousarray(
+                    self.transform_force_constants(force_constants, len(structure.positions))
+                )
+                self._raw_force_constants = force_constants
+            transformed_force_constants = self._transformed_force_constants
             transformed_displacements = self.transform_displacements(dr)
             transformed_forces = -np.dot(transformed_force_constants, transformed_displacements)
             retransformed_forces = self.retransform_forces(transformed_forces, dr)
             if mask is not None:
                 forces = retransformed_forces[mask]
-                energy = -0.5 * np.dot(forces, dr[mask])
+                # The mask may be a scalar atom id (e.g. a vacancy id), so contract over whatever shape it leaves
+                energy = -0.5 * np.sum(forces * dr[mask])
             else:
                 forces = retransformed_forces
-                energy = -0.5 * np.tensordot(forces, dr)
+                energy = -0.5 * np.einsum('ij,ij->', forces, dr)
 
         else:
             raise TypeError('Please specify either a spring constant or the force constant matrix')
@@ -652,7 +670,7 @@ class LangevinThermostat(PrimitiveVertex):
 
     def command(self, velocities, masses, temperature, damping_timescale, time_step, fix_com):
         # Ensure that masses are a commensurate shape
-        masses = np.array(masses)[:, np.newaxis]
+        masses = np.asarray(masses, dtype=np.float64)[:, np.newaxis]
         gamma = masses / damping_timescale
         np.random.seed()
         noise = np.sqrt(2 * (gamma / time_step) * KB * temperature) * np.random.randn(*velocities.shape)
@@ -915,7 +933,7 @@ class RandomVelocity(PrimitiveVertex):
         self.input.default.overheat_fraction = 2.
 
     def command(self, temperature, masses, overheat_fraction):
-        masses = np.array(masses)[:, np.newaxis]
+        masses = np.asarray(masses, dtype=np.float64)[:, np.newaxis]
         vel_scale = np.sqrt(EV_TO_U_ANGSQ_PER_FSSQ * KB * temperature / masses) * np.sqrt(overheat_fraction)
         np.random.seed(0)
         vel_dir = np.random.randn(len(masses), 3)
@@ -1011,11 +1029,21 @@ class SphereReflectionPerAtom(PrimitiveVertex):
         total_steps += 1
         if use_reflection:
             distance = np.linalg.norm(structure.find_mic(reference_positions - positions), axis=-1)
-            is_at_home = (distance < cutoff_distance)[:, np.newaxis]
-            is_away = 1 - is_at_home
+            at_home = distance < cutoff_distance
         else:
-            is_at_home = np.ones(len(reference_positions))
-            is_away = 1 - is_at_home
+            at_home = np.ones(len(reference_positions), dtype=bool)
+
+        if np.all(at_home):
+            # Nothing strayed (or reflection is off), so skip the full-array blend below
+            return {
+                'positions': positions,
+                'velocities': velocities,
+                'reflected': np.zeros(len(reference_positions), dtype=bool),
+                'total_steps': total_steps
+            }
+
+        is_at_home = at_home[:, np.newaxis]
+        is_away = 1 - is_at_home
 
         return {
             'positions': is_at_home * positions + is_away * previous_positions,
@@ -1117,8 +1145,10 @@ class VerletParent(PrimitiveVertex, ABC):
 
     @staticmethod
     def reshape_masses(masses):
-        if len(np.array(masses).shape) == 1:
-            masses = np.array(masses)[:, np.newaxis]
+        # asarray so per-step calls with an ndarray don't re-copy the masses
+        masses = np.asarray(masses, dtype=np.float64)
+        if masses.ndim == 1:
+            masses = masses[:, np.newaxis]
         return masses
 
     @staticmethod
@@ -1414,12 +1444,12 @@ class TILDPostProcess(PrimitiveVertex):
     @staticmethod
     def get_tild_free_energy(lambda_pairs, tild_mean, tild_std, n_samples):
         y = unumpy.uarray(tild_mean, tild_std)
-        integral = simps(x=lambda_pairs[:, 0], y=y)
+        integral = simpson(x=lambda_pairs[:, 0], y=y)
         mean = unumpy.nominal_values(integral)
         std = unumpy.std_devs(integral)
         tild_se = tild_std / np.sqrt(n_samples)
         y_se = unumpy.uarray(tild_mean, tild_se)
-        integral_se = simps(x=lambda_pairs[:, 0], y=y_se)
+        integral_se = simpson(x=lambda_pairs[:, 0], y=y_se)
         se = unumpy.std_devs(integral_se)
 
         return float(mean), float(std), float(se)
@@ -1429,11 +1459,9 @@ class TILDPostProcess(PrimitiveVertex):
         fep_exp_se = fep_exp_std / np.sqrt(n_samples)
         y = unumpy.uarray(fep_exp_mean, fep_exp_std)
         y_se = unumpy.uarray(fep_exp_mean, fep_exp_se)
-        free_energy = 0
-        free_energy_se = 0
-        for (val, val_se) in zip(y, y_se):
-            free_energy += -KB * temperature * unumpy.log(val)
-            free_energy_se += -KB * temperature * unumpy.log(val_se)
+        # The sum of -kT log terms is just -kT times the summed logs, so evaluate it in one vectorized call
+        free_energy = -KB * temperature * np.sum(unumpy.log(y))
+        free_energy_se = -KB * temperature * np.sum(unumpy.log(y_se))
         mean = unumpy.nominal_values(free_energy)
         std = unumpy.std_devs(free_energy)
         se = unumpy.std_devs(free_energy_se)
@@ -1495,7 +1523,8 @@ class BerendsenBarostat(PrimitiveVertex):
         isotropic_pressure = np.trace(box_pressure) / 3  # pyiron stores pressure in GPa
 
         if pressure is None:
-            new_structure = structure.copy()
+            # No barostat is applied, so pass the structure through instead of deep-copying it every step
+            new_structure = structure
             total_pressure = isotropic_pressure
         elif pressure is not None and pressure_style == 'isotropic':
             new_structure = structure.copy()
@@ -1542,16 +1571,14 @@ class ComputeFormationEnergy(PrimitiveVertex):
     def command(self, n_atoms, eq_energy, harm_to_inter_mean, harm_to_inter_std, harm_to_inter_se, inter_to_vac_mean,
                 inter_to_vac_std, inter_to_vac_se):
 
-        harm_to_inter_fe = unumpy.uarray(harm_to_inter_mean, harm_to_inter_std)
-        harm_to_inter_fe_se = unumpy.uarray(harm_to_inter_mean, harm_to_inter_se)
-        inter_to_vac_fe = unumpy.uarray(inter_to_vac_mean, inter_to_vac_std)
-        inter_to_vac_fe_se = unumpy.uarray(inter_to_vac_mean, inter_to_vac_se)
-
-        fe = ((eq_energy + harm_to_inter_fe) / n_atoms) + inter_to_vac_fe
-        fe_se = ((eq_energy + harm_to_inter_fe_se) / n_atoms) + inter_to_vac_fe_se
+        # The formation energy is a linear combination of independent contributions, so the uncertainties propagate
+        # in closed form and the symbolic bookkeeping of unumpy.uarray is not needed
+        fe_mean = ((eq_energy + harm_to_inter_mean) / n_atoms) + inter_to_vac_mean
+        fe_std = np.sqrt((harm_to_inter_std / n_atoms) ** 2 + inter_to_vac_std ** 2)
+        fe_se = np.sqrt((harm_to_inter_se / n_atoms) ** 2 + inter_to_vac_se ** 2)
 
         return {
-            'formation_energy_mean': float(unumpy.nominal_values(fe)),
-            'formation_energy_std': float(unumpy.std_devs(fe)),
-            'formation_energy_se': float(unumpy.std_devs(fe_se))
+            'formation_energy_mean': float(fe_mean),
+            'formation_energy_std': float(fe_std),
+            'formation_energy_se': float(fe_se)
         }
@@ -239,10 +239,8 @@ class IODictionary(dict, LoggerMixin):
                         result.append(self._generic_from_hdf(server, group_name=k))
                         indices.append(index)
 
-                    # sort it, with the keys as indices
-                    result = sorted(enumerate(result), key=lambda t: indices[t[0]])
-                    # create the instance, and get rid of the instances
-                    result = cls_([val for idx, val in result])
+                    # restore the original element order from the stored indices
+                    result = cls_([result[i] for i in np.argsort(indices)])
                     return result
                 else:
                     raise ImportError('Could not locate type(%s)' % server['FULLNAME'])
@@ -257,9 +255,11 @@ class IODictionary(dict, LoggerMixin):
                 # default value is not to save any property
                 try:
                     value = getattr(self, key)
-                    try:
+                    # Explicit check instead of catching AttributeError: most values are primitives/ndarrays, so
+                    # the exception would get raised and swallowed on every key of every save
+                    if hasattr(value, 'to_hdf'):
                         value.to_hdf(hdf5_server, group_name=key)
-                    except AttributeError:
+                    else:
                         self._generic_to_hdf(value, hdf5_server, group_name=key)
                 except KeyError:
                     # to_hdf will get called *before* protocols have run, so the pointers in these dictionaries
@@ -275,12 +275,10 @@ class IODictionary(dict, LoggerMixin):
                     # hdf5_server.h5_path is relative
                     del hdf5_server[posixpath.join(hdf5_server.h5_path, key)]
                     # now we try again
-                    try:
+                    if hasattr(value, 'to_hdf'):
                         value.to_hdf(hdf5_server, group_name=key)
-                    except AttributeError:
+                    else:
                         self._generic_to_hdf(value, hdf5_server, group_name=key)
-                    except Exception:
-                        raise
 
     def from_hdf(self, hdf, group_name):
         with hdf.open(group_name) as hdf5_server:
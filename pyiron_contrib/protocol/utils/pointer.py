@@ -3,6 +3,7 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 from enum import Enum
+from itertools import islice
 from pyiron_contrib.protocol.utils.misc import  LoggerMixin, requires_arguments
 from types import MethodType, FunctionType
 
@@ -148,7 +149,7 @@ class Path(list, LoggerMixin):
             super(Path, self).append(item)
 
     def extend(self, collection):
-        if not all([isinstance(item, Crumb) for item in collection]):
+        if not all(isinstance(item, Crumb) for item in collection):
             raise TypeError('A path can only consist of crumbs')
         else:
             super(Path, self).extend(collection)
@@ -210,18 +211,14 @@ class Pointer(LoggerMixin):
             The underlying data object, hiding behind path parameter
 
         """
-        # Make a copy to ensure, because by passing by reference
-        path = self.path.copy()
-
         # Have a look at the path and check that it starts with a root crumb
-        root = path.pop(0)
+        root = self.path[0]
         if root.crumb_type != CrumbType.Root:
             raise ValueError('Got invalid path. A valid path starts with a root object')
-        # First element is always an object
+        # First element is always an object; iterate over the remaining crumbs in a single pass instead of copying
+        # the path and popping from the front, which is quadratic in the path depth
         result = root.object
-        while len(path) > 0:
-            # Take one step in the path, pop the next crumb from the list
-            crumb = path.pop(0)
+        for crumb in islice(self.path, 1, None):
             crumb_type = crumb.crumb_type
             crumb_name = crumb.name
             # If the result is a pointer itself we have to resolve it first
@@ -30,27 +30,27 @@ setup(
 
     keywords='pyiron',
     packages=find_packages(exclude=["*tests*"]),
-    install_requires=[        
-        'matplotlib==3.5.2',
-        'numpy==1.22.3',
-        'pyiron_base==0.5.12',
-        'scipy==1.8.0',
-        'seaborn==0.11.2',
-        'pyparsing==3.0.8'
+    install_requires=[
+        'matplotlib>=3.5',
+        'numpy>=1.24,<3',
+        'pyiron_base>=0.5.12',
+        'scipy>=1.10',
+        'seaborn>=0.11',
+        'pyparsing>=3.0'
     ],
     extras_require={
         'atomistic': [
-            'ase==3.22.1',
-            'pyiron_atomistics==0.2.45',
+            'ase>=3.22',
+            'pyiron_atomistics>=0.2.45',
         ],
         'fenics': [
             'fenics==2019.1.0',
             'mshr==2019.1.0',
         ],
-        'image': ['scikit-image==0.19.2'],
+        'image': ['scikit-image>=0.19'],
         'generic': [
-            'boto3==1.22.9', 
-            'moto==3.1.8'
+            'boto3>=1.22',
+            'moto>=3.1'
         ],
     },
     cmdclass=versioneer.get_cmdclass(),
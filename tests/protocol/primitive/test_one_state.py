@@ -0,0 +1,68 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import unittest
+import numpy as np
+from pyiron_atomistics.atomistics.structure.atoms import Atoms
+from pyiron_contrib.protocol.primitive.one_state import HarmonicHamiltonian
+
+
+class TestHarmonicHamiltonian(unittest.TestCase):
+    """
+    Test the spring and Hessian branches, each with no mask, an array mask, and a scalar mask (the vacancy
+    protocols wire `mask` straight from the integer `vacancy_id`).
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.structure = Atoms(
+            symbols=["Fe", "Fe", "Fe", "Fe"],
+            positions=[[0, 0, 0], [0.5, 0.5, 0], [0.5, 0, 0.5], [0, 0.5, 0.5]],
+            cell=np.eye(3),
+            pbc=True,
+        )
+        cls.reference_positions = cls.structure.positions.copy()
+        np.random.seed(42)
+        cls.positions = cls.reference_positions + 0.01 * np.random.randn(4, 3)
+        cls.dr = cls.structure.find_mic(cls.positions - cls.reference_positions)
+
+    def test_spring_masks(self):
+        vertex = HarmonicHamiltonian()
+        spring_constant = 2.
+        for mask in [None, np.array([0, 2]), 0]:
+            output = vertex.command(
+                positions=self.positions,
+                reference_positions=self.reference_positions,
+                structure=self.structure,
+                spring_constant=spring_constant,
+                mask=mask,
+            )
+            dr = self.dr if mask is None else self.dr[mask]
+            self.assertEqual(np.ndim(output['energy_pot']), 0)
+            self.assertAlmostEqual(output['energy_pot'], 0.5 * spring_constant * np.sum(dr * dr))
+            self.assertTrue(np.allclose(output['forces'], -spring_constant * dr))
+
+    def test_hessian_masks(self):
+        vertex = HarmonicHamiltonian()
+        spring_constant = 2.
+        # A diagonal Hessian reproduces independent springs, so the expected values stay analytic
+        force_constants = np.zeros((4, 4, 3, 3))
+        for i in range(4):
+            force_constants[i, i] = spring_constant * np.eye(3)
+        for mask in [None, np.array([0, 2]), 0]:
+            output = vertex.command(
+                positions=self.positions,
+                reference_positions=self.reference_positions,
+                structure=self.structure,
+                force_constants=force_constants,
+                mask=mask,
+            )
+            dr = self.dr if mask is None else self.dr[mask]
+            self.assertEqual(np.ndim(output['energy_pot']), 0)
+            self.assertAlmostEqual(output['energy_pot'], 0.5 * spring_constant * np.sum(dr * dr))
+            self.assertTrue(np.allclose(output['forces'], -spring_constant * dr))
+
+
+if __name__ == '__main__':
+    unittest.main()